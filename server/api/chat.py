@@ -1,4 +1,6 @@
+import orjson
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Union
 
@@ -9,6 +11,9 @@ from core.security import verify_token
 router = APIRouter()
 security = HTTPBearer()
 
+# One NDJSON line per event; NumPy values from the analysts serialize natively
+_STREAM_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Get current user from JWT token."""
     token = credentials.credentials
@@ -59,6 +64,27 @@ async def send_message(
             detail=f"Internal server error: {str(e)}"
         )
 
+@router.post("/message/stream")
+async def stream_message(
+    request: ChatRequest,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Stream trading analysis phases as newline-delimited JSON.
+    
+    Args:
+        request: Chat request containing the user message
+        current_user: Current authenticated user
+        
+    Returns:
+        StreamingResponse emitting one JSON object per completed phase
+    """
+    async def event_lines():
+        async for event in chat_service.stream_message(request.message):
+            yield orjson.dumps(event, default=str, option=_STREAM_OPTIONS)
+    
+    return StreamingResponse(event_lines(), media_type="application/x-ndjson")
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint for the chat service."""
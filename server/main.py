@@ -1,13 +1,27 @@
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from api import auth, chat
 from db.db import create_tables, test_connection
+from trader_agent.coordinator_agent import WorkflowIdFilter
 import uvicorn
 
+# Tag every log line with the trading workflow it was emitted from ("-" outside one)
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(levelname)s:%(name)s:[%(workflow_id)s] %(message)s",
+    force=True
+)
+for handler in logging.getLogger().handlers:
+    handler.addFilter(WorkflowIdFilter())
+
 app = FastAPI(
     title="Trading Agent API",
     description="API for the trading agent",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -1,10 +1,10 @@
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Optional
 from datetime import datetime
 import uuid
 import logging
 
 from schemas.chat_schema import ChatResponse, TradingAnalysisData, AnalystScores, ResearchAssessment, TradingDecision
-from trader_agent.coordinator_agent import orchestrate_trading_analysis
+from trader_agent.coordinator_agent import orchestrate_trading_analysis, stream_trading_analysis
 from trader_agent.agents.analysts.ticker_agent import TickerAgent
 
 logger = logging.getLogger(__name__)
@@ -40,7 +40,7 @@ class ChatService:
             extracted_input = await self._extract_company_from_message(message.strip())
             
             # Execute the complete trading workflow
-            analysis_result = orchestrate_trading_analysis(extracted_input)
+            analysis_result = await orchestrate_trading_analysis(extracted_input)
             
             # Check if workflow completed successfully
             if analysis_result.get("workflow_status") == "completed":
@@ -102,6 +102,20 @@ class ChatService:
                 session_id=session_id,
             )
 
+    async def stream_message(self, message: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream partial trading analysis results for a user message.
+        
+        Args:
+            message: User input (company name, ticker, or natural language query)
+            
+        Yields:
+            One dict per completed workflow phase, ending with the final result
+        """
+        extracted_input = await self._extract_company_from_message(message.strip())
+        async for event in stream_trading_analysis(extracted_input):
+            yield event
+
     async def _extract_company_from_message(self, message: str) -> str:
         """
         Extract company name or ticker from natural language input using TickerAgent.
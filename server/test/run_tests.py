@@ -59,6 +59,7 @@ def main():
         (test_dir / "trader_agent" / "agents" / "utils" / "test_historical.py", "Historical data integration test"),
         (test_dir / "trader_agent" / "agents" / "utils" / "test_ticker_resolution.py", "Ticker resolution tests"),
         (test_dir / "trader_agent" / "agents" / "utils" / "test_integration.py", "Full integration tests"),
+        (test_dir / "trader_agent" / "test_coordinator_agent.py", "Coordinator agent tests"),
     ]
     
     print("🚀 Starting Trading Agent Test Suite")
@@ -19,7 +19,7 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 
 def run_test():
     """
-    Runs a test of the get_historical_data function and prints the full results.
+    Runs a test of the get_historical_data function and prints a summary of the results.
     """
     if not DEPENDENCIES_AVAILABLE:
         print("❌ SKIPPED: Required dependencies (pandas, dotenv, yfinance) not available")
@@ -40,11 +40,17 @@ def run_test():
     # Check the result
     if isinstance(historical_df, pd.DataFrame) and not historical_df.empty:
         print(f"\n✅ SUCCESS: Retrieved {len(historical_df)} data points for {ticker}.")
-        print("--- Complete Fetched Data ---")
+        print("--- Fetched Data (first and last rows) ---")
         
-        # Use pandas option_context to temporarily display all rows and columns
-        with pd.option_context('display.max_rows', None, 'display.max_columns', None):
-            print(historical_df)
+        # Formatting every cell of a large frame dominates the runtime, so show
+        # the ends plus a structural summary instead of the full table
+        print(historical_df.head(5))
+        if len(historical_df) > 10:
+            print(f"... {len(historical_df) - 10} rows omitted ...")
+            print(historical_df.tail(5))
+        elif len(historical_df) > 5:
+            print(historical_df.iloc[5:])
+        historical_df.info(memory_usage='deep')
             
         print("---------------------------")
     else:
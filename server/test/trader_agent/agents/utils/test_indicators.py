@@ -85,6 +85,17 @@ class TestIndicators(unittest.TestCase):
         self.assertIsNone(sma(self.invalid_prices, 3))
 
 
+    def test_indicators_accept_numpy_arrays(self):
+        """Test indicators give the same results for a numpy array as for a list."""
+        import numpy as np
+        prices = np.array(self.prices_extra_long, dtype=np.float64)
+        self.assertAlmostEqual(sma(prices, 5), sma(self.prices_extra_long, 5))
+        self.assertAlmostEqual(ema(prices, 10), ema(self.prices_extra_long, 10))
+        self.assertAlmostEqual(rsi(prices, 14), rsi(self.prices_extra_long, 14))
+        self.assertEqual(macd(prices, 12, 26, 9), macd(self.prices_extra_long, 12, 26, 9))
+        self.assertIsNone(sma(np.array([]), 5))
+
+
 
     # --- Tests for ema() ---
 
@@ -215,6 +226,27 @@ class TestIndicators(unittest.TestCase):
         self.assertEqual(result, [])
 
 
+    def test_indicators_on_downcast_frame(self):
+        """Test indicators on a float32/int32 OHLCV frame match the float64 results."""
+        n = len(self.prices_extra_long)
+        df = pd.DataFrame({
+            'Open': self.prices_extra_long,
+            'High': [p + 1 for p in self.prices_extra_long],
+            'Low': [p - 1 for p in self.prices_extra_long],
+            'Close': self.prices_extra_long,
+            'Volume': [1000000] * n
+        }).astype({'Open': 'float32', 'High': 'float32', 'Low': 'float32',
+                   'Close': 'float32', 'Volume': 'int32'})
+        
+        closes = df['Close'].to_numpy()
+        self.assertEqual(closes.dtype, 'float32')
+        # Indicators upcast to float64 internally, so results match the list version
+        self.assertAlmostEqual(sma(closes, 5), sma(self.prices_extra_long, 5))
+        self.assertAlmostEqual(rsi(closes, 14), rsi(self.prices_extra_long, 14))
+        self.assertAlmostEqual(macd(closes)['macd_line'], macd(self.prices_extra_long)['macd_line'])
+        self.assertEqual(extract_closing_prices(df), self.prices_extra_long)
+
+
     def test_extract_closing_prices_df_with_nan(self):
         """Test extracting from a DataFrame containing NaN values."""
         prices_with_nan = self.prices_long + [pd.NA]
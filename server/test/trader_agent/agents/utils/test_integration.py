@@ -19,6 +19,8 @@ import os
 import tempfile
 import shutil
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from unittest.mock import patch, MagicMock, mock_open
 from typing import Dict, List, Any
 
@@ -60,12 +62,12 @@ class TestHTTPClient(unittest.TestCase):
         http_client.CACHE_DIR = self.original_cache_dir
         shutil.rmtree(self.temp_cache_dir, ignore_errors=True)
     
-    @patch('trader_agent.agents.utils.http_client.requests.get')
+    @patch('trader_agent.agents.utils.http_client._SESSION.get')
     def test_get_json_success(self, mock_get):
         """Test successful JSON GET request"""
         # Mock successful response
         mock_response = MagicMock()
-        mock_response.json.return_value = {"test": "data", "value": 123}
+        mock_response.content = b'{"test": "data", "value": 123}'
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -76,14 +78,14 @@ class TestHTTPClient(unittest.TestCase):
         self.assertEqual(result["value"], 123)
         mock_get.assert_called_once()
     
-    @patch('trader_agent.agents.utils.http_client.requests.get')
+    @patch('trader_agent.agents.utils.http_client._SESSION.get')
     def test_get_json_retry_on_failure(self, mock_get):
         """Test retry mechanism on request failure"""
         import requests
     
         # Create a proper mock response for the successful attempt
         mock_success_response = MagicMock()
-        mock_success_response.json.return_value = {"retry": "success"}
+        mock_success_response.content = b'{"retry": "success"}'
         mock_success_response.raise_for_status.return_value = None
     
         # Configure side_effect: fail twice, then succeed
@@ -99,14 +101,46 @@ class TestHTTPClient(unittest.TestCase):
         self.assertEqual(result["retry"], "success")
         self.assertEqual(mock_get.call_count, 3)
 
+    @patch('trader_agent.agents.utils.http_client._SESSION.get')
+    def test_get_json_coalesces_concurrent_requests(self, mock_get):
+        """Test concurrent identical requests share one upstream fetch"""
+        callers = 4
+        followers_joined = threading.Event()
+        waiting = []
+
+        class JoinTrackingFuture(Future):
+            def result(self, timeout=None):
+                waiting.append(self)
+                if len(waiting) == callers - 1:
+                    followers_joined.set()
+                return super().result(timeout)
+
+        mock_response = MagicMock()
+        mock_response.content = b'{"shared": true}'
+        mock_response.raise_for_status.return_value = None
+
+        def blocking_get(*args, **kwargs):
+            # Stay in flight until every other caller has joined this request
+            self.assertTrue(followers_joined.wait(timeout=5))
+            return mock_response
+        mock_get.side_effect = blocking_get
+
+        with patch('trader_agent.agents.utils.http_client.Future', JoinTrackingFuture), \
+                ThreadPoolExecutor(max_workers=callers) as executor:
+            futures = [executor.submit(http_client.get_json, "https://test.com/shared", use_cache=False)
+                       for _ in range(callers)]
+            results = [f.result() for f in futures]
+
+        self.assertEqual(results, [{"shared": True}] * callers)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(http_client._INFLIGHT, {})
 
-    
     def test_cache_functionality(self):
         """Test caching mechanism"""
         # Test cache key generation
         cache_key = http_client._cache_key("https://test.com", {"header": "value"})
         self.assertIsInstance(cache_key, str)
-        self.assertEqual(len(cache_key), 32)  # MD5 hash length
+        self.assertEqual(len(cache_key), 32)  # 16-byte BLAKE2b digest as hex
         
         # Test cache save and load
         test_data = {"cached": "data", "timestamp": 123456}
@@ -114,6 +148,13 @@ class TestHTTPClient(unittest.TestCase):
         
         loaded_data = http_client._load_from_cache(cache_key)
         self.assertEqual(loaded_data, test_data)
+
+    def test_cache_ttl(self):
+        """Test cache entries expire after the given TTL"""
+        http_client._save_to_cache("ttl_key", {"fresh": True})
+        self.assertEqual(http_client._load_from_cache("ttl_key", ttl=60), {"fresh": True})
+        self.assertIsNone(http_client._load_from_cache("ttl_key", ttl=-1))
+        self.assertFalse(os.path.exists(http_client._cache_path("ttl_key")))
     
     def test_clear_cache(self):
         """Test cache clearing functionality"""
@@ -141,6 +182,15 @@ class TestNASDAQAPI(unittest.TestCase):
     def setUp(self):
         if not DEPENDENCIES_AVAILABLE:
             self.skipTest("Dependencies not available")
+
+        # Keep cached frames from leaking between tests
+        self.temp_cache_dir = tempfile.mkdtemp()
+        self.original_cache_dir = http_client.CACHE_DIR
+        http_client.CACHE_DIR = self.temp_cache_dir
+
+    def tearDown(self):
+        http_client.CACHE_DIR = self.original_cache_dir
+        shutil.rmtree(self.temp_cache_dir, ignore_errors=True)
     
     def test_date_utilities(self):
         """Test date utility functions"""
@@ -202,6 +252,21 @@ class TestNASDAQAPI(unittest.TestCase):
         self.assertEqual(len(result), 3)
         self.assertIn('Close', result.columns)
     
+    @patch('trader_agent.agents.utils.nasdaq_api.yf.Ticker')
+    def test_get_historical_data_cached(self, mock_ticker_class):
+        """Test repeated historical fetches are served from the cache"""
+        mock_ticker = MagicMock()
+        mock_ticker.history.return_value = pd.DataFrame(
+            {'Close': [104.0, 105.0]}, index=pd.date_range('2023-01-01', periods=2))
+        mock_ticker_class.return_value = mock_ticker
+
+        first = nasdaq_api.get_historical_data("AAPL", "3mo")
+        second = nasdaq_api.get_historical_data("aapl", "3mo")
+        nasdaq_api.get_historical_data("AAPL", "3mo", use_cache=False)
+
+        pd.testing.assert_frame_equal(first, second)
+        self.assertEqual(mock_ticker.history.call_count, 2)
+
     @patch('trader_agent.agents.utils.nasdaq_api.yf.Ticker')
     def test_get_historical_data_empty_response(self, mock_ticker_class):
         """Test handling of empty historical data response"""
@@ -267,6 +332,37 @@ class TestNASDAQAPI(unittest.TestCase):
         self.assertEqual(result[0]["title"], "Apple Reports Strong Earnings")
         self.assertEqual(result[1]["source"], "Bloomberg")
 
+    @patch('trader_agent.agents.utils.nasdaq_api.curl_requests.Session')
+    def test_resolve_ticker_cached(self, mock_session_class):
+        """Test resolved tickers are cached on disk and reused"""
+        mock_response = MagicMock()
+        mock_response.content = b'{"quotes": [{"symbol": "aapl", "longname": "Apple Inc.", "quoteType": "EQUITY"}]}'
+        mock_session_class.return_value.get.return_value = mock_response
+
+        self.assertEqual(nasdaq_api.resolve_ticker("Apple"), "AAPL")
+        self.assertEqual(nasdaq_api.resolve_ticker(" apple "), "AAPL")
+        self.assertEqual(mock_session_class.return_value.get.call_count, 1)
+
+        nasdaq_api.resolve_ticker("Apple", use_cache=False)
+        self.assertEqual(mock_session_class.return_value.get.call_count, 2)
+
+    @patch('trader_agent.agents.utils.nasdaq_api.get_company_data')
+    def test_get_multiple_tickers_data(self, mock_get_company):
+        """Test concurrent multi-ticker fetch keeps per-ticker results and failures"""
+        def fake_company(ticker, **kwargs):
+            if ticker == "BAD":
+                raise RuntimeError("boom")
+            return {"symbol": ticker}
+
+        mock_get_company.side_effect = fake_company
+
+        result = nasdaq_api.get_multiple_tickers_data(["AAPL", "BAD", "MSFT"], "company")
+
+        self.assertEqual(result, {"AAPL": {"symbol": "AAPL"}, "BAD": None, "MSFT": {"symbol": "MSFT"}})
+        self.assertEqual(list(result), ["AAPL", "BAD", "MSFT"])
+        self.assertEqual(mock_get_company.call_count, 3)
+        self.assertEqual(nasdaq_api.get_multiple_tickers_data(["AAPL"], "unknown"), {})
+
 
 class TestIndicators(unittest.TestCase):
     """Test technical indicators functionality"""
@@ -547,6 +643,14 @@ class TestIntegration(unittest.TestCase):
     def setUp(self):
         if not DEPENDENCIES_AVAILABLE:
             self.skipTest("Dependencies not available")
+
+        self.temp_cache_dir = tempfile.mkdtemp()
+        self.original_cache_dir = http_client.CACHE_DIR
+        http_client.CACHE_DIR = self.temp_cache_dir
+
+    def tearDown(self):
+        http_client.CACHE_DIR = self.original_cache_dir
+        shutil.rmtree(self.temp_cache_dir, ignore_errors=True)
     
     @patch('trader_agent.agents.utils.nasdaq_api.yf.Ticker')
     def test_end_to_end_flow(self, mock_ticker_class):
@@ -4,15 +4,18 @@ Test script for scoring module functionality.
 
 import sys
 import os
+import traceback
 
 # Add the server directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../'))
 
 from trader_agent.agents.utils.scoring import (
     fundamentals_score, 
+    fundamentals_score_batch,
     technical_score, 
     sentiment_score, 
     news_score,
+    NewsBatch,
     technical_score_from_prices,
     composite_score
 )
@@ -43,9 +46,38 @@ def test_fundamentals_score():
     print(f"Empty data score: {empty_score:.2f}")
     assert empty_score == 50.0, "Empty data should return neutral score"
     
+    # Test with too few populated fields
+    thin_score = fundamentals_score({"symbol": "THIN", "market_cap": "$2.5T", "pe_ratio": "18.5", "volume": ""})
+    print(f"Thin data score: {thin_score:.2f}")
+    assert thin_score == 50.0, "Fewer than 3 populated fields should return neutral score"
+    
     print("✓ fundamentals_score() tests passed\n")
 
 
+def test_fundamentals_score_batch():
+    """Test batch fundamentals scoring matches the per-company scorer."""
+    print("Testing fundamentals_score_batch()...")
+    
+    companies = [
+        {"market_cap": "$2.5T", "pe_ratio": "18.5", "dividend_yield": "0.5%",
+         "volume": "50000000", "avg_volume": "45000000",
+         "price": "150.00", "high_52week": "180.00", "low_52week": "120.00"},
+        {"market_cap": "$5.1B", "pe_ratio": "42", "dividend_yield": "7%",
+         "volume": "1,000", "avg_volume": "2,000"},
+        {"market_cap": "$500M", "pe_ratio": "3", "dividend_yield": "9.5%"},
+        {"market_cap": "N/A", "pe_ratio": "--"},
+        {},
+    ]
+    
+    batch = fundamentals_score_batch(companies)
+    expected = [fundamentals_score(company) for company in companies]
+    print(f"Batch scores: {[round(float(x), 2) for x in batch]}")
+    assert batch.tolist() == expected, f"Batch {batch.tolist()} != scalar {expected}"
+    assert len(fundamentals_score_batch([])) == 0, "Empty batch should return empty array"
+    
+    print("✓ fundamentals_score_batch() tests passed\n")
+
+
 def test_technical_score():
     """Test technical scoring with sample indicators."""
     print("Testing technical_score()...")
@@ -124,6 +156,66 @@ def test_news_score():
     print("✓ news_score() tests passed\n")
 
 
+def test_news_batch():
+    """Test columnar NewsBatch input scores the same as article dicts."""
+    print("Testing NewsBatch input...")
+    
+    articles = [
+        {"title": "Company beats earnings expectations", "summary": "Strong growth reported"},
+        {"title": "SEC probe announced", "summary": None},
+        "not an article",
+        {"title": "Partnership deal signed", "summary": "Layoff fears ease"},
+    ]
+    batch = NewsBatch.from_dicts(articles)
+    
+    assert len(batch.titles) == len(batch.summaries) == 3, "Non-dict entries should be skipped"
+    assert sentiment_score(batch) == sentiment_score(articles), "Sentiment should match dict input"
+    assert news_score(batch) == news_score(articles), "News score should match dict input"
+    
+    direct = NewsBatch(titles=["Record revenue"], summaries=["Guidance raise"])
+    print(f"Direct batch sentiment: {sentiment_score(direct):.2f}, news: {news_score(direct):.2f}")
+    assert news_score(direct) > 50, "High-impact positive news should score above neutral"
+    assert sentiment_score(NewsBatch([], [])) == 50.0, "Empty batch should return neutral score"
+    
+    print("✓ NewsBatch tests passed\n")
+
+
+def test_keyword_weights():
+    """Test keyword matching used by sentiment_score() and news_score()."""
+    print("Testing keyword weights...")
+    
+    # Keywords in two lists carry both weights
+    partnership_score = news_score([{"title": "Partnership", "summary": ""}])
+    print(f"'partnership' news score: {partnership_score:.2f}")
+    assert partnership_score == 50.0 + 10 + 2, "partnership should score high-impact and general weight"
+    
+    recall_score = news_score([{"title": "Recall", "summary": ""}])
+    print(f"'recall' news score: {recall_score:.2f}")
+    assert recall_score == 50.0 - 12 - 2, "recall should score high-impact and general weight"
+    
+    # A keyword repeated within one article counts once
+    repeated_score = news_score([{"title": "deal deal deal", "summary": "deal"}])
+    print(f"Repeated keyword news score: {repeated_score:.2f}")
+    assert repeated_score == 52.0, "Repeated keyword should only count once per article"
+    
+    repeated_sentiment = sentiment_score([
+        {"title": "profit profit profit", "summary": "loss"}
+    ])
+    print(f"Repeated keyword sentiment score: {repeated_sentiment:.2f}")
+    assert repeated_sentiment == 50.0, "Repeated keyword should only count once per article"
+    
+    # Missing or empty text is handled ("upgraded" also matches "upgrade")
+    none_summary = [{"title": "Stock upgraded", "summary": None}]
+    assert sentiment_score(none_summary) == 100.0, "None summary should be treated as empty"
+    assert news_score(none_summary) == 54.0, "None summary should be treated as empty"
+    
+    empty_text = [{"title": "", "summary": ""}]
+    assert sentiment_score(empty_text) == 50.0, "Empty text should return neutral score"
+    assert news_score(empty_text) == 50.0, "Empty text should return neutral score"
+    
+    print("✓ keyword weight tests passed\n")
+
+
 def test_technical_score_from_prices():
     """Test technical scoring from price data."""
     print("Testing technical_score_from_prices()...")
@@ -173,9 +265,12 @@ def main():
     
     try:
         test_fundamentals_score()
+        test_fundamentals_score_batch()
         test_technical_score()
         test_sentiment_score()
         test_news_score()
+        test_news_batch()
+        test_keyword_weights()
         test_technical_score_from_prices()
         test_composite_score()
         
@@ -183,7 +278,6 @@ def main():
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
-        import traceback
         traceback.print_exc()
 
 
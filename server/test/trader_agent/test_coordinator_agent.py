@@ -0,0 +1,344 @@
+"""
+Test script for coordinator agent helpers.
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+import traceback
+from unittest.mock import patch
+
+# Add the server directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../'))
+
+from trader_agent import coordinator_agent
+from trader_agent.agents.researchers.researcher_bear import calculate_bearish_assessment
+from trader_agent.coordinator_agent import (
+    execute_analysis,
+    execute_analyst_layer,
+    generate_executive_summary,
+    orchestrate_trading_analysis,
+    stream_trading_analysis,
+    validate_trading_decision,
+    validate_trading_decisions_batch
+)
+
+
+def test_execute_analyst_layer_bundle():
+    """Test the analyst bundle maps each analyst's score key and defaults failures."""
+    print("Testing execute_analyst_layer() bundle...")
+
+    def failing_news(ticker):
+        raise RuntimeError("news feed down")
+
+    with patch.dict(coordinator_agent._ANALYST_PIPELINE, {
+        "fundamentals": (lambda ticker: {"fundamental_score": 72.0},),
+        "technical": (lambda ticker: {"technical_score": 61.0},),
+        "sentiment": (lambda ticker: {"sentiment_score": 40.0},),
+        "news": (failing_news,)
+    }):
+        result = asyncio.run(execute_analyst_layer("AAPL"))
+
+    bundle = result["analyst_bundle"]
+    print(f"Bundle scores: F:{bundle['fundamentals_score']} T:{bundle['technical_score']} "
+          f"S:{bundle['sentiment_score']} N:{bundle['news_score']}")
+    assert result["success"], "A failed analyst should not fail the layer"
+    assert bundle["fundamentals_score"] == 72.0, "Fundamentals should read the fundamental_score key"
+    assert bundle["news_score"] == 50.0, "Failed analyst should default to neutral"
+    assert bundle["raw_data"]["news"] == {"news_score": 50.0, "error": "news feed down", "status": "failed"}
+    assert result["errors"] == ["news analysis failed: news feed down"], "Failure should reach the layer"
+
+    # The bear researcher reads the bundle's fundamentals_score as well
+    weak = calculate_bearish_assessment({**bundle, "fundamentals_score": 10.0})
+    strong = calculate_bearish_assessment({**bundle, "fundamentals_score": 90.0})
+    assert weak["bear_score"] > strong["bear_score"], "Bear score should respond to fundamentals"
+
+    print("✓ execute_analyst_layer() bundle tests passed\n")
+
+
+def test_execute_analyst_layer_fail_fast():
+    """Test fail_fast returns as soon as one analyst fails and cancels the rest."""
+    print("Testing execute_analyst_layer(fail_fast=True)...")
+
+    release = threading.Event()
+
+    def failing_fundamentals(ticker):
+        raise RuntimeError("fundamentals feed down")
+
+    def slow_analyst(ticker):
+        release.wait(timeout=5)
+        return {"technical_score": 70.0}
+
+    with patch.dict(coordinator_agent._ANALYST_PIPELINE, {
+        "fundamentals": (failing_fundamentals,),
+        "technical": (slow_analyst,),
+        "sentiment": (slow_analyst,),
+        "news": (slow_analyst,)
+    }):
+        start = time.monotonic()
+        result = asyncio.run(execute_analyst_layer("AAPL", fail_fast=True))
+        elapsed = time.monotonic() - start
+    release.set()
+
+    raw_data = result["analyst_bundle"]["raw_data"]
+    print(f"Fail-fast layer returned in {elapsed:.2f}s with errors: {result['errors']}")
+    assert elapsed < 2.0, "Layer should not wait for the slow analysts"
+    assert result["success"], "Fail-fast still returns a neutral bundle"
+    assert raw_data["fundamentals"]["error"] == "fundamentals feed down"
+    for analyst_type in ("technical", "sentiment", "news"):
+        assert raw_data[analyst_type]["status"] == "failed"
+        assert "cancelled" in raw_data[analyst_type]["error"], f"{analyst_type} should be cancelled"
+        assert result["analyst_bundle"][f"{analyst_type}_score"] == 50.0
+    assert len(result["errors"]) == 4
+
+    print("✓ execute_analyst_layer(fail_fast=True) tests passed\n")
+
+
+def test_workflow_cache():
+    """Test a repeat analysis of the same ticker reuses the cached workflow."""
+    print("Testing workflow result cache...")
+
+    calls = []
+
+    def analyst(ticker):
+        calls.append(ticker)
+        return {"fundamental_score": 65.0}
+
+    coordinator_agent._WORKFLOW_CACHE.clear()
+    with patch.object(
+        coordinator_agent,
+        "validate_workflow_inputs",
+        return_value={"valid": True, "ticker": "AAPL", "company_name": "Apple"}
+    ), patch.dict(coordinator_agent._ANALYST_PIPELINE, {
+        "fundamentals": (analyst,),
+        "technical": (analyst,),
+        "sentiment": (analyst,),
+        "news": (analyst,)
+    }):
+        first = asyncio.run(orchestrate_trading_analysis("Apple"))
+        second = asyncio.run(orchestrate_trading_analysis("Apple"))
+
+        with patch.object(coordinator_agent, "WORKFLOW_CACHE_SECONDS", -1):
+            expired = asyncio.run(orchestrate_trading_analysis("Apple"))
+    coordinator_agent._WORKFLOW_CACHE.clear()
+
+    print(f"Analyst calls: {len(calls)}, second run cached: {second.get('cached')}")
+    assert "cached" not in first, "First run should execute the pipeline"
+    assert second["cached"] and second["workflow_status"] == "completed"
+    assert second["workflow_id"] == first["workflow_id"], "Cached run should return the stored result"
+    assert "cached" not in expired, "Expired entry should re-run the pipeline"
+    assert len(calls) == 8, "Analysts should only run for the uncached workflows"
+
+    # A run with a failed analyst is returned but never cached
+    def failing_analyst(ticker):
+        raise RuntimeError("upstream outage")
+
+    with patch.object(
+        coordinator_agent,
+        "validate_workflow_inputs",
+        return_value={"valid": True, "ticker": "MSFT", "company_name": "Microsoft"}
+    ), patch.dict(coordinator_agent._ANALYST_PIPELINE, {
+        "fundamentals": (analyst,),
+        "technical": (failing_analyst,),
+        "sentiment": (analyst,),
+        "news": (analyst,)
+    }):
+        degraded = asyncio.run(orchestrate_trading_analysis("Microsoft"))
+    print(f"Degraded run status: {degraded['workflow_status']}, cached tickers: {list(coordinator_agent._WORKFLOW_CACHE)}")
+    assert degraded["workflow_status"] == "completed"
+    assert "MSFT" not in coordinator_agent._WORKFLOW_CACHE, "Failed analyst runs should not be cached"
+    coordinator_agent._WORKFLOW_CACHE.clear()
+
+    print("✓ workflow cache tests passed\n")
+
+
+def _drain(user_input):
+    """Collect every event stream_trading_analysis yields for an input."""
+    async def collect():
+        return [event async for event in stream_trading_analysis(user_input)]
+    return asyncio.run(collect())
+
+
+def test_stream_trading_analysis():
+    """Test the event stream yields each phase in order and ends with the final result."""
+    print("Testing stream_trading_analysis()...")
+
+    valid = {"valid": True, "ticker": "AAPL", "company_name": "Apple"}
+    coordinator_agent._WORKFLOW_CACHE.clear()
+    with patch.object(coordinator_agent, "validate_workflow_inputs", return_value=valid), \
+            patch.dict(coordinator_agent._ANALYST_PIPELINE, {
+                "fundamentals": (lambda ticker: {"fundamental_score": 80.0},),
+                "technical": (lambda ticker: {"technical_score": 70.0},),
+                "sentiment": (lambda ticker: {"sentiment_score": 65.0},),
+                "news": (lambda ticker: {"news_score": 60.0},)
+            }):
+        events = _drain("Apple")
+        coordinator_agent._WORKFLOW_CACHE.clear()
+        final = asyncio.run(orchestrate_trading_analysis("Apple"))
+    coordinator_agent._WORKFLOW_CACHE.clear()
+
+    phases = [event.get("phase") for event in events[:-1]]
+    print(f"Streamed phases: {phases}")
+    assert phases == ["validation", "analysis", "research", "consensus"]
+    assert events[0]["partial"] == {"ticker": "AAPL", "company_name": "Apple"}
+    assert events[1]["partial"] == {"fundamentals": 80.0, "technical": 70.0, "sentiment": 65.0, "news": 60.0}
+    assert all(event["workflow_id"] == events[-1]["workflow_id"] for event in events)
+
+    last = events[-1]
+    assert last["workflow_status"] == "completed" and "partial" not in last
+    for key in ("ticker", "analyst_scores", "research_assessment", "trading_decision", "executive_summary"):
+        assert last[key] == final[key], f"Streamed {key} should match orchestrate_trading_analysis"
+
+    # The workflow id only tags logs while the workflow runs
+    async def workflow_id_after_stream():
+        async for _ in stream_trading_analysis("???"):
+            pass
+        return coordinator_agent.workflow_id_var.get()
+
+    with patch.object(coordinator_agent, "validate_workflow_inputs", return_value={"valid": False, "error": "x"}):
+        assert asyncio.run(workflow_id_after_stream()) == "-", "workflow_id_var should be reset"
+
+    # Failures end the stream with a single failed event for the phase
+    invalid = {"valid": False, "error": "Unknown ticker", "ticker": None}
+    with patch.object(coordinator_agent, "validate_workflow_inputs", return_value=invalid):
+        failed = _drain("???")
+    assert len(failed) == 1 and failed[0]["status"] == "failed" and failed[0]["phase"] == "validation"
+
+    async def failing_layer(ticker, fail_fast=False):
+        return {"success": False, "error": "analysts down", "analyst_bundle": {}}
+
+    with patch.object(coordinator_agent, "validate_workflow_inputs", return_value=valid), \
+            patch.object(coordinator_agent, "execute_analyst_layer", failing_layer):
+        failed = _drain("Apple")
+    print(f"Failed stream: {[event['phase'] for event in failed]}")
+    assert [event["phase"] for event in failed] == ["validation", "analysis"]
+    assert failed[-1]["status"] == "failed" and failed[-1]["error"] == "analysts down"
+
+    print("✓ stream_trading_analysis() tests passed\n")
+
+
+def test_execute_analysis():
+    """Test the table-driven analyst dispatch chains steps and handles failures."""
+    print("Testing execute_analysis()...")
+
+    with patch.dict(coordinator_agent._ANALYST_PIPELINE, {
+        "technical": (lambda ticker: [1.0, 2.0, 3.0], len, lambda n: {"technical_score": n * 10.0})
+    }):
+        assert execute_analysis("technical", "AAPL") == {"technical_score": 30.0}
+
+    with patch.object(coordinator_agent, "fetch_historical_data", return_value={"error": "No data"}):
+        failed = execute_analysis("technical", "AAPL")
+    print(f"Failed technical analysis: {failed}")
+    assert failed == {"technical_score": 50.0, "error": "No data"}
+
+    print("✓ execute_analysis() tests passed\n")
+
+
+def test_generate_executive_summary():
+    """Test executive summaries per stance and action."""
+    print("Testing generate_executive_summary()...")
+
+    buy = generate_executive_summary(
+        {"stance": "bullish", "net_score": 30.43, "confidence": 54.34},
+        {"action": "BUY", "position_size": 3.31}
+    )
+    print(f"Bullish summary: {buy}")
+    assert buy == (
+        "Analysis recommends BUY with 3.3% portfolio allocation. Research consensus is bullish "
+        "with net score of 30.4 and 54% confidence. Positive fundamentals and sentiment support upside potential."
+    )
+
+    hold = generate_executive_summary({"stance": "bearish"}, {"action": "HOLD", "position_size": 5.0})
+    assert hold.startswith("Analysis recommends HOLD. "), "HOLD should omit the allocation"
+    assert hold.endswith("Risk factors and negative signals suggest caution.")
+
+    unknown = generate_executive_summary({"stance": "mixed"}, {})
+    assert "consensus is mixed" in unknown and unknown.endswith("Mixed signals warrant neutral positioning.")
+
+    print("✓ generate_executive_summary() tests passed\n")
+
+
+def test_validate_trading_decisions_batch():
+    """Test batch validation bounds positions and overrides low-confidence trades."""
+    print("Testing validate_trading_decisions_batch()...")
+
+    decisions = [
+        {"action": "BUY", "position_size": 35.0, "confidence": 80.0, "rationale": "Strong"},
+        {"action": "SELL", "position_size": 5.0, "confidence": 30.0, "rationale": "Weak"},
+        {"action": "HOLD", "position_size": -2.0, "confidence": 10.0, "rationale": "Flat"},
+        {"action": "BUY", "position_size": 3.14159, "confidence": 61.905, "rationale": "Ok"},
+    ]
+
+    validated = validate_trading_decisions_batch(decisions)
+    for decision in validated:
+        print(f"  {decision['action']} {decision['position_size']}% @ {decision['confidence']}")
+
+    assert validated is decisions, "Decisions should be updated in place"
+    assert validated[0]["position_size"] == 20.0, "Position size should be capped at 20%"
+    assert validated[1]["action"] == "HOLD", "Low-confidence trade should be overridden to HOLD"
+    assert validated[1]["position_size"] == 0.0, "Overridden trade should have no position"
+    assert validated[1]["rationale"].endswith("[Overridden to HOLD due to insufficient confidence]")
+    assert validated[2]["position_size"] == 0.0, "Negative position size should be floored at 0"
+    assert validated[2]["rationale"] == "Flat", "HOLD decisions are never overridden"
+    assert validated[3]["position_size"] == 3.14, "Position size should be rounded to 2 places"
+    assert validated[3]["confidence"] == round(61.905, 2), "Rounding should match built-in round()"
+    assert validate_trading_decisions_batch([]) == [], "Empty batch should return empty list"
+
+    # A missing rationale on an override fails the batch without a partial update
+    partial_batch = [
+        {"action": "BUY", "position_size": 35.0, "confidence": 80.0, "rationale": "Strong"},
+        {"action": "SELL", "position_size": 5.0, "confidence": 30.0}
+    ]
+    try:
+        validate_trading_decisions_batch(partial_batch)
+        raise AssertionError("Override without a rationale should raise KeyError")
+    except KeyError:
+        pass
+    assert partial_batch[0]["position_size"] == 35.0, "Earlier decisions should be left untouched"
+    assert partial_batch[1]["action"] == "SELL", "Failing decision should be left untouched"
+
+    print("✓ validate_trading_decisions_batch() tests passed\n")
+
+
+def test_validate_trading_decision():
+    """Test the single-decision wrapper matches the batch and falls back to HOLD."""
+    print("Testing validate_trading_decision()...")
+
+    decision = {"action": "BUY", "position_size": 12.345, "confidence": 45.0, "rationale": "Ok"}
+    expected = validate_trading_decisions_batch([dict(decision)])[0]
+    assert validate_trading_decision(decision) == expected, "Wrapper should match batch result"
+
+    # An override without a rationale to annotate falls back to the default HOLD
+    fallback = validate_trading_decision({"action": "BUY", "position_size": 5.0, "confidence": 10.0})
+    print(f"Fallback decision: {fallback['action']} - {fallback['rationale']}")
+    assert fallback["action"] == "HOLD" and fallback["position_size"] == 0.0
+    assert fallback["rationale"].startswith("Validation error")
+
+    print("✓ validate_trading_decision() tests passed\n")
+
+
+def main():
+    """Run all tests."""
+    print("Running coordinator agent tests...\n")
+
+    try:
+        test_execute_analyst_layer_bundle()
+        test_execute_analyst_layer_fail_fast()
+        test_workflow_cache()
+        test_stream_trading_analysis()
+        test_execute_analysis()
+        test_generate_executive_summary()
+        test_validate_trading_decisions_batch()
+        test_validate_trading_decision()
+
+        print("🎉 All coordinator agent tests passed successfully!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -28,7 +28,7 @@ def calculate_bearish_assessment(analyst_scores: Dict[str, Any]) -> Dict[str, An
     
     Args:
         analyst_scores: Dict containing scores from all 4 analysts:
-            - fundamental_score: Float (0-100)
+            - fundamentals_score (or fundamental_score): Float (0-100)
             - sentiment_score: Float (0-100) 
             - technical_score: Float (0-100)
             - news_score: Float (0-100)
@@ -53,7 +53,8 @@ def calculate_bearish_assessment(analyst_scores: Dict[str, Any]) -> Dict[str, An
     
     try:
         # Extract scores with defaults
-        fundamental_score = analyst_scores.get("fundamental_score", 50.0)
+        # The coordinator bundle uses "fundamentals_score"; the fundamentals agent uses "fundamental_score"
+        fundamental_score = analyst_scores.get("fundamentals_score", analyst_scores.get("fundamental_score", 50.0))
         sentiment_score = analyst_scores.get("sentiment_score", 50.0)
         technical_score = analyst_scores.get("technical_score", 50.0)
         news_score = analyst_scores.get("news_score", 50.0)
@@ -4,15 +4,18 @@ Prevents each agent from re-implementing API fetch logic.
 """
 import os
 import json
+import pickle
 import time
 import hashlib
 import random
 import logging
+import threading
+from concurrent.futures import Future
 from typing import Dict, Any, Optional, Union
 from functools import lru_cache
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +29,10 @@ DEFAULT_HEADERS = {
     ),
 }
 
+# In-flight GET requests keyed by cache key, so concurrent callers share one fetch
+_INFLIGHT: Dict[str, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
 # Cache directory for persistent caching
 CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", ".cache")
 os.makedirs(CACHE_DIR, exist_ok=True)
@@ -38,7 +45,8 @@ def _cache_key(url: str, headers: Optional[Dict[str, str]] = None) -> str:
         # Include relevant headers in cache key
         sorted_headers = sorted(headers.items())
         cache_data += str(sorted_headers)
-    return hashlib.md5(cache_data.encode("utf-8")).hexdigest()
+    # 128-bit BLAKE2b: faster than MD5 and keeps the 32-char hex key length
+    return hashlib.blake2b(cache_data.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def _cache_path(cache_key: str) -> str:
@@ -46,8 +54,8 @@ def _cache_path(cache_key: str) -> str:
     return os.path.join(CACHE_DIR, cache_key + ".json")
 
 
-def _load_from_cache(cache_key: str) -> Optional[Dict[str, Any]]:
-    """Load data from cache file if it exists and is valid."""
+def _load_from_cache(cache_key: str, ttl: int = 3600) -> Optional[Dict[str, Any]]:
+    """Load data from cache file if it exists and is younger than ttl seconds."""
     cache_file = _cache_path(cache_key)
     if not os.path.exists(cache_file):
         return None
@@ -59,8 +67,8 @@ def _load_from_cache(cache_key: str) -> Optional[Dict[str, Any]]:
         # Check if cache has expired (optional timestamp-based expiry)
         if "timestamp" in cached_data:
             cache_age = time.time() - cached_data["timestamp"]
-            # Cache expires after 1 hour by default
-            if cache_age > 3600:
+            # Cache expires after ttl seconds (1 hour by default)
+            if cache_age > ttl:
                 os.remove(cache_file)
                 return None
                 
@@ -89,25 +97,63 @@ def _save_to_cache(cache_key: str, data: Dict[str, Any]) -> None:
         logger.warning(f"Failed to save cache for key {cache_key}: {e}")
 
 
-def _create_session_with_retries(retries: int = 3) -> requests.Session:
-    """Create a requests session with retry strategy."""
-    session = requests.Session()
-    
-    # Configure retry strategy
-    retry_strategy = Retry(
-        total=retries,
-        status_forcelist=[429, 500, 502, 503, 504],
-        method_whitelist=["HEAD", "GET", "OPTIONS"],
-        backoff_factor=1
-    )
+def _object_cache_path(cache_key: str) -> str:
+    """Get the file path for a pickled cache entry."""
+    return os.path.join(CACHE_DIR, cache_key + ".pkl")
+
+
+def load_object_from_cache(cache_key: str, ttl: int) -> Optional[Any]:
+    """
+    Load a pickled object (e.g. a DataFrame) from cache if younger than ttl seconds.
+
+    Used for results that are not JSON, so they can be restored without re-parsing.
+    """
+    cache_file = _object_cache_path(cache_key)
+    try:
+        if time.time() - os.path.getmtime(cache_file) > ttl:
+            os.remove(cache_file)
+            return None
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError) as e:
+        logger.warning(f"Failed to load cache for key {cache_key}: {e}")
+        try:
+            os.remove(cache_file)
+        except OSError:
+            pass
+        return None
+
+
+def save_object_to_cache(cache_key: str, obj: Any) -> None:
+    """Pickle an object to the cache directory."""
+    cache_file = _object_cache_path(cache_key)
+    try:
+        with open(cache_file, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except (OSError, pickle.PicklingError, TypeError) as e:
+        logger.warning(f"Failed to save cache for key {cache_key}: {e}")
+
+
+def _create_session(pool_connections: int = 32, pool_maxsize: int = 64) -> requests.Session:
+    """
+    Create a requests session with a pooled adapter.
     
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    Retries are handled by get_json/post_json themselves, so the adapter
+    only provides keep-alive connection reuse across calls and threads.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
-    
     return session
 
 
+# Shared session so repeated calls to the same host reuse TCP/TLS connections
+_SESSION = _create_session()
+
+
 def get_json(
     url: str,
     headers: Optional[Dict[str, str]] = None,
@@ -138,13 +184,50 @@ def get_json(
         request_headers.update(headers)
     
     # Check cache first
-    cache_key = _cache_key(url, request_headers) if use_cache else None
-    if use_cache and cache_key:
-        cached_data = _load_from_cache(cache_key)
+    cache_key = _cache_key(url, request_headers)
+    if use_cache:
+        cached_data = _load_from_cache(cache_key, cache_ttl)
         if cached_data is not None:
             logger.debug(f"Cache hit for URL: {url}")
             return cached_data
     
+    # Join an identical request that is already in flight
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(cache_key)
+        is_leader = future is None
+        if is_leader:
+            future = _INFLIGHT[cache_key] = Future()
+    
+    if not is_leader:
+        logger.debug(f"Joining in-flight request for URL: {url}")
+        return future.result()
+    
+    try:
+        data = _fetch_json(url, request_headers, retries, backoff_factor, timeout)
+        
+        # Save to cache if enabled
+        if use_cache and data is not None:
+            _save_to_cache(cache_key, data)
+            logger.debug(f"Cached response for URL: {url}")
+        
+        future.set_result(data)
+        return data
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[cache_key]
+
+
+def _fetch_json(
+    url: str,
+    request_headers: Dict[str, str],
+    retries: int,
+    backoff_factor: float,
+    timeout: int
+) -> Optional[Dict[str, Any]]:
+    """Perform a GET request with retries and return the parsed JSON, or None."""
     # Make the request with retries
     last_exception = None
     
@@ -152,20 +235,15 @@ def get_json(
         try:
             logger.debug(f"Attempting request to {url} (attempt {attempt + 1}/{retries})")
             
-            response = requests.get(
+            response = _SESSION.get(
                 url,
                 headers=request_headers,
                 timeout=timeout
             )
             response.raise_for_status()
             
-            # Parse JSON response
-            data = response.json()
-            
-            # Save to cache if enabled
-            if use_cache and cache_key:
-                _save_to_cache(cache_key, data)
-                logger.debug(f"Cached response for URL: {url}")
+            # Parse JSON response (orjson decodes the raw bytes directly)
+            data = orjson.loads(response.content)
             
             logger.debug(f"Successfully fetched data from {url}")
             return data
@@ -232,7 +310,7 @@ def post_json(
         try:
             logger.debug(f"Attempting POST to {url} (attempt {attempt + 1}/{retries})")
             
-            response = requests.post(
+            response = _SESSION.post(
                 url,
                 json=data,
                 headers=request_headers,
@@ -241,7 +319,7 @@ def post_json(
             response.raise_for_status()
             
             # Parse JSON response
-            result = response.json()
+            result = orjson.loads(response.content)
             logger.debug(f"Successfully posted data to {url}")
             return result
             
@@ -277,7 +355,7 @@ def clear_cache() -> None:
     """Clear all cached files."""
     try:
         for filename in os.listdir(CACHE_DIR):
-            if filename.endswith(".json"):
+            if filename.endswith((".json", ".pkl")):
                 os.remove(os.path.join(CACHE_DIR, filename))
         logger.info("Cache cleared successfully")
     except OSError as e:
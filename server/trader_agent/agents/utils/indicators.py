@@ -6,6 +6,8 @@ Pure math/statistics utilities for technical indicators.
 Does not fetch any data — only calculates indicators from price data.
 
 
+Functions accept a list of prices or a 1-D numpy array.
+
 Functions:
 - sma(prices: List[float], window: int) -> Optional[float]
 - ema(prices: List[float], window: int) -> Optional[float] 
@@ -22,13 +24,37 @@ Passes results into scoring.py for score conversion
 
 import logging
 from typing import List, Optional, Dict, Union
+import numpy as np
+import pandas as pd
 
 
 logger = logging.getLogger(__name__)
 
+Prices = Union[List[float], np.ndarray]
+
+
+
+def _price_array(prices: Prices) -> Optional[np.ndarray]:
+    """
+    Convert prices to a float64 array once, for the vectorized calculations.
+    
+    Returns:
+        float64 array, or None if prices is not a non-empty numeric list/array
+    """
+    if isinstance(prices, np.ndarray):
+        if prices.ndim != 1 or prices.size == 0:
+            return None
+    elif not prices or not isinstance(prices, list):
+        return None
+    
+    try:
+        return np.asarray(prices, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+
 
 
-def sma(prices: List[float], window: int) -> Optional[float]:
+def sma(prices: Prices, window: int) -> Optional[float]:
     """
     Calculate Simple Moving Average.
     
@@ -39,7 +65,8 @@ def sma(prices: List[float], window: int) -> Optional[float]:
     Returns:
         SMA value or None if insufficient data
     """
-    if not prices or not isinstance(prices, list):
+    arr = _price_array(prices)
+    if arr is None:
         logger.error("Invalid prices data provided to SMA calculation")
         return None
         
@@ -47,60 +74,57 @@ def sma(prices: List[float], window: int) -> Optional[float]:
         logger.error(f"Invalid window size for SMA: {window}")
         return None
         
-    if len(prices) < window:
-        logger.warning(f"Insufficient data for SMA calculation: need {window}, got {len(prices)}")
+    if arr.size < window:
+        logger.warning(f"Insufficient data for SMA calculation: need {window}, got {arr.size}")
         return None
     
-    try:
-        # Use the last 'window' prices
-        recent_prices = prices[-window:]
-        sma_value = sum(recent_prices) / window
-        logger.debug(f"Calculated SMA({window}): {sma_value:.4f}")
-        return sma_value
-    except (TypeError, ValueError) as e:
-        logger.error(f"Error calculating SMA: {e}")
-        return None
+    # Use the last 'window' prices
+    sma_value = float(arr[-window:].mean())
+    logger.debug(f"Calculated SMA({window}): {sma_value:.4f}")
+    return sma_value
 
 
 
 
-def _ema_series(prices: List[float], window: int) -> List[float]:
+def _ema_series(prices: Prices, window: int) -> np.ndarray:
     """
     Calculate Exponential Moving Average series.
     
     Args:
-        prices: List of price values
+        prices: List or array of price values
         window: EMA period/span
         
     Returns:
-        List of EMA values (empty if insufficient data)
+        Array of EMA values (empty if insufficient data)
     """
-    if len(prices) < window:
-        return []
-    
     try:
-        # Smoothing factor
-        multiplier = 2.0 / (window + 1)
-        ema_values = []
-        
-        # Initialize with SMA of first 'window' prices
-        initial_sma = sum(prices[:window]) / window
-        ema_values.append(initial_sma)
-        
-        # Calculate EMA for remaining prices
-        for price in prices[window:]:
-            ema_value = (price * multiplier) + (ema_values[-1] * (1 - multiplier))
-            ema_values.append(ema_value)
-            
-        return ema_values
+        arr = np.asarray(prices, dtype=np.float64)
+        if arr.size < window:
+            return np.empty(0)
+        
+        # Initialize with SMA of first 'window' prices, then apply the
+        # standard recurrence (alpha = 2 / (window + 1)) in pandas' C loop
+        return _seeded_ewm(arr, window, alpha=2.0 / (window + 1))
     except (TypeError, ValueError, ZeroDivisionError) as e:
         logger.error(f"Error calculating EMA series: {e}")
-        return []
+        return np.empty(0)
+
+
+def _seeded_ewm(values: np.ndarray, window: int, alpha: float) -> np.ndarray:
+    """
+    Exponentially smooth values[window - 1:] after seeding with the mean of values[:window].
+    
+    Equivalent to: s = mean(values[:window]); s = alpha * x + (1 - alpha) * s for
+    each later x, returning every intermediate s.
+    """
+    seeded = values[window - 1:].copy()
+    seeded[0] = values[:window].mean()
+    return pd.Series(seeded).ewm(alpha=alpha, adjust=False).mean().to_numpy()
 
 
 
 
-def ema(prices: List[float], window: int) -> Optional[float]:
+def ema(prices: Prices, window: int) -> Optional[float]:
     """
     Calculate Exponential Moving Average.
     
@@ -111,7 +135,8 @@ def ema(prices: List[float], window: int) -> Optional[float]:
     Returns:
         Latest EMA value or None if insufficient data
     """
-    if not prices or not isinstance(prices, list):
+    arr = _price_array(prices)
+    if arr is None:
         logger.error("Invalid prices data provided to EMA calculation")
         return None
         
@@ -119,16 +144,16 @@ def ema(prices: List[float], window: int) -> Optional[float]:
         logger.error(f"Invalid window size for EMA: {window}")
         return None
         
-    if len(prices) < window:
-        logger.warning(f"Insufficient data for EMA calculation: need {window}, got {len(prices)}")
+    if arr.size < window:
+        logger.warning(f"Insufficient data for EMA calculation: need {window}, got {arr.size}")
         return None
     
     try:
-        ema_series_values = _ema_series(prices, window)
-        if not ema_series_values:
+        ema_series_values = _ema_series(arr, window)
+        if not ema_series_values.size:
             return None
             
-        ema_value = ema_series_values[-1]
+        ema_value = float(ema_series_values[-1])
         logger.debug(f"Calculated EMA({window}): {ema_value:.4f}")
         return ema_value
     except Exception as e:
@@ -138,7 +163,7 @@ def ema(prices: List[float], window: int) -> Optional[float]:
 
 
 
-def rsi(prices: List[float], window: int = 14) -> Optional[float]:
+def rsi(prices: Prices, window: int = 14) -> Optional[float]:
     """
     Calculate Relative Strength Index.
     
@@ -149,7 +174,8 @@ def rsi(prices: List[float], window: int = 14) -> Optional[float]:
     Returns:
         RSI value (0-100) or None if insufficient data
     """
-    if not prices or not isinstance(prices, list):
+    arr = _price_array(prices)
+    if arr is None:
         logger.error("Invalid prices data provided to RSI calculation")
         return None
         
@@ -158,28 +184,23 @@ def rsi(prices: List[float], window: int = 14) -> Optional[float]:
         return None
         
     # Need at least window + 1 prices to calculate price changes
-    if len(prices) < window + 1:
-        logger.warning(f"Insufficient data for RSI calculation: need {window + 1}, got {len(prices)}")
+    if arr.size < window + 1:
+        logger.warning(f"Insufficient data for RSI calculation: need {window + 1}, got {arr.size}")
         return None
     
     try:
         # Calculate price changes over the entire series
-        changes = [prices[i] - prices[i-1] for i in range(1, len(prices))]
+        changes = np.diff(arr)
         
         # Separate gains and losses
-        gains = [c if c > 0 else 0 for c in changes]
-        losses = [-c if c < 0 else 0 for c in changes]
-
+        gains = np.maximum(changes, 0.0)
+        losses = np.maximum(-changes, 0.0)
 
-        # Calculate initial average gain and loss using simple moving average
-        avg_gain = sum(gains[:window]) / window
-        avg_loss = sum(losses[:window]) / window
 
-
-        # Smooth the rest of the values using a standard RSI smoothing method
-        for i in range(window, len(gains)):
-            avg_gain = (avg_gain * (window - 1) + gains[i]) / window
-            avg_loss = (avg_loss * (window - 1) + losses[i]) / window
+        # Seed with the simple average of the first 'window' changes, then apply
+        # Wilder's smoothing (alpha = 1 / window) to the rest
+        avg_gain = float(_seeded_ewm(gains, window, alpha=1.0 / window)[-1])
+        avg_loss = float(_seeded_ewm(losses, window, alpha=1.0 / window)[-1])
             
         # Handle edge case where avg_loss is 0 to avoid division by zero
         if avg_loss == 0:
@@ -198,7 +219,7 @@ def rsi(prices: List[float], window: int = 14) -> Optional[float]:
 
 
 
-def macd(prices: List[float], short_win: int = 12, long_win: int = 26, signal: int = 9) -> Dict[str, Optional[float]]:
+def macd(prices: Prices, short_win: int = 12, long_win: int = 26, signal: int = 9) -> Dict[str, Optional[float]]:
     """
     Calculate MACD (Moving Average Convergence Divergence).
     
@@ -211,7 +232,8 @@ def macd(prices: List[float], short_win: int = 12, long_win: int = 26, signal: i
     Returns:
         Dict with 'macd_line', 'signal_line', and 'histogram' values
     """
-    if not prices or not isinstance(prices, list):
+    arr = _price_array(prices)
+    if arr is None:
         logger.error("Invalid prices data provided to MACD calculation")
         return {"macd_line": None, "signal_line": None, "histogram": None}
         
@@ -225,23 +247,23 @@ def macd(prices: List[float], short_win: int = 12, long_win: int = 26, signal: i
     
     # Check if there's enough data for the longest EMA calculation plus the signal line
     # The EMA of the MACD line (signal) requires its own window
-    if len(prices) < long_win + signal:
-        logger.warning(f"Insufficient data for MACD: need {long_win + signal}, got {len(prices)}")
+    if arr.size < long_win + signal:
+        logger.warning(f"Insufficient data for MACD: need {long_win + signal}, got {arr.size}")
         return {"macd_line": None, "signal_line": None, "histogram": None}
     
     try:
         # Calculate fast and slow EMA series
-        fast_ema_series = _ema_series(prices, short_win)
-        slow_ema_series = _ema_series(prices, long_win)
+        fast_ema_series = _ema_series(arr, short_win)
+        slow_ema_series = _ema_series(arr, long_win)
         
-        if not fast_ema_series or not slow_ema_series:
+        if not fast_ema_series.size or not slow_ema_series.size:
             logger.error("Failed to calculate EMA series for MACD")
             return {"macd_line": None, "signal_line": None, "histogram": None}
         
         # Create the MACD line. It starts where the slow EMA starts.
         # Align the fast EMA to match the starting point of the slow EMA.
         offset = len(fast_ema_series) - len(slow_ema_series)
-        macd_line_series = [fast_ema_series[i + offset] - slow_ema_series[i] for i in range(len(slow_ema_series))]
+        macd_line_series = fast_ema_series[offset:] - slow_ema_series
 
 
         # Check if we have enough MACD line data to calculate the signal line
@@ -252,13 +274,13 @@ def macd(prices: List[float], short_win: int = 12, long_win: int = 26, signal: i
         # Calculate signal line (EMA of MACD line)
         signal_line_series = _ema_series(macd_line_series, signal)
         
-        if not signal_line_series:
+        if not signal_line_series.size:
             logger.error("Failed to calculate signal line for MACD")
             return {"macd_line": None, "signal_line": None, "histogram": None}
         
         # Get latest values
-        macd_line_value = macd_line_series[-1]
-        signal_line_value = signal_line_series[-1]
+        macd_line_value = float(macd_line_series[-1])
+        signal_line_value = float(signal_line_series[-1])
         histogram_value = macd_line_value - signal_line_value
         
         result = {
@@ -11,15 +11,27 @@ Agents can call these functions directly without handling URLs or HTTP details.
 
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple
+import orjson
 import pandas as pd
 import yfinance as yf
 from curl_cffi import requests as curl_requests
 import re
 
 # http_client is still needed for the other (deprecated) functions
-from .http_client import get_json, DEFAULT_HEADERS
+from .http_client import (
+    get_json,
+    DEFAULT_HEADERS,
+    _cache_key,
+    _load_from_cache,
+    _save_to_cache,
+    load_object_from_cache,
+    save_object_to_cache,
+)
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
@@ -27,6 +39,12 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Per-endpoint cache lifetimes in seconds
+COMPANY_CACHE_TTL = 15 * 60
+NEWS_CACHE_TTL = 30 * 60
+HISTORICAL_CACHE_TTL = 24 * 60 * 60
+TICKER_CACHE_TTL = 90 * 24 * 60 * 60  # Name -> symbol mappings rarely change
+
 
 def _iso_date(d: date) -> str:
     """Convert date object to ISO format string (YYYY-MM-DD)."""
@@ -36,12 +54,24 @@ def _iso_date(d: date) -> str:
 def _default_date_range(months: int = 3) -> tuple[str, str]:
     """
     Generate default date range for historical data queries.
+    
+    Cached per wall-clock minute so batch fetches reuse the same strings.
     """
+    return _cached_date_range(months, int(time.time() // 60))
+
+
+@lru_cache(maxsize=32)
+def _cached_date_range(months: int, minute_bucket: int) -> tuple[str, str]:
+    """Compute the date range; minute_bucket only scopes the cache entry."""
     end_date = date.today()
     start_date = end_date - timedelta(days=30 * months)
     return _iso_date(start_date), _iso_date(end_date)
 
 
+_PERIOD_RE = re.compile(r"^(\d+)\s*(mo|m|y|d)$")
+_PERIOD_MONTHS = {"mo": 1, "m": 1, "y": 12}
+
+
 def _parse_period_to_months(period: str) -> int:
     """
     Parse period string to number of months.
@@ -55,28 +85,18 @@ def _parse_period_to_months(period: str) -> int:
     if not period or not isinstance(period, str):
         logger.warning(f"Invalid period type: {type(period)}, defaulting to 3 months")
         return 3
-        
-    period = period.lower().strip()
     
-    try:
-        if period.endswith('mo'):
-            return int(period[:-2])
-        elif period.endswith('m'):
-            return int(period[:-1])
-        elif period.endswith('y'):
-            return int(period[:-1]) * 12
-        elif period.endswith('d'):
-            # Convert days to approximate months
-            days = int(period[:-1])
-            return max(1, days // 30)
-        else:
-            # Default fallback for any unrecognized format
-            logger.warning(f"Unknown period format: {period}, defaulting to 3 months")
-            return 3
-    except (ValueError, IndexError) as e:
-        # Handle any parsing errors gracefully
-        logger.warning(f"Failed to parse period '{period}': {e}. Using default 3 months")
+    match = _PERIOD_RE.match(period.lower().strip())
+    if not match:
+        # Default fallback for any unrecognized format
+        logger.warning(f"Unknown period format: {period}, defaulting to 3 months")
         return 3
+    
+    count, unit = int(match.group(1)), match.group(2)
+    if unit == "d":
+        # Convert days to approximate months
+        return max(1, count // 30)
+    return count * _PERIOD_MONTHS[unit]
 
 
 def resolve_ticker(company_name: str, use_cache: bool = True) -> Optional[str]:
@@ -86,7 +106,7 @@ def resolve_ticker(company_name: str, use_cache: bool = True) -> Optional[str]:
     
     Args:
         company_name: Company name to search for (e.g., "Apple Inc", "Microsoft")
-        use_cache: Whether to use HTTP caching for the search request
+        use_cache: Whether to reuse a previously resolved ticker from the on-disk cache
         
     Returns:
         Official ticker symbol (e.g., "AAPL", "MSFT") or None if not found
@@ -96,6 +116,14 @@ def resolve_ticker(company_name: str, use_cache: bool = True) -> Optional[str]:
         return None
     
     company_name = company_name.strip()
+    
+    cache_key = _cache_key(f"ticker:{company_name.lower()}") if use_cache else None
+    if cache_key:
+        cached_ticker = _load_from_cache(cache_key, TICKER_CACHE_TTL)
+        if cached_ticker:
+            logger.debug(f"Cache hit for ticker resolution: {company_name} -> {cached_ticker}")
+            return cached_ticker
+    
     logger.info(f"Resolving ticker for company: {company_name}")
     
     try:
@@ -125,7 +153,7 @@ def resolve_ticker(company_name: str, use_cache: bool = True) -> Optional[str]:
         response = session.get(search_url, params=params, headers=headers, timeout=15)
         response.raise_for_status()
         
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
         
         if not response_data:
             logger.error(f"Failed to get search results for: {company_name}")
@@ -163,6 +191,9 @@ def resolve_ticker(company_name: str, use_cache: bool = True) -> Optional[str]:
         
         if best_match:
             logger.info(f"Successfully resolved '{company_name}' to ticker: {best_match}")
+            # Only successful lookups are cached, so misses are retried next time
+            if cache_key:
+                _save_to_cache(cache_key, best_match.upper())
             return best_match.upper()
         else:
             logger.warning(f"Could not resolve ticker for: {company_name}")
@@ -175,6 +206,30 @@ def resolve_ticker(company_name: str, use_cache: bool = True) -> Optional[str]:
 
 
 
+def resolve_tickers(company_names: List[str], use_cache: bool = True) -> Dict[str, Optional[str]]:
+    """
+    Resolve several company names concurrently.
+    
+    Each lookup is a network round-trip, so they run on a thread pool and
+    the total time is roughly that of the slowest single lookup.
+    
+    Args:
+        company_names: Company names to search for
+        use_cache: Passed through to resolve_ticker
+        
+    Returns:
+        Dict mapping each company name to its ticker, or None if not found
+    """
+    if not company_names:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(16, len(company_names))) as executor:
+        tickers = executor.map(lambda name: resolve_ticker(name, use_cache=use_cache), company_names)
+        return dict(zip(company_names, tickers))
+
+
+
+
 # --- Normalization functions for deprecated endpoints ---
 
 def _normalize_company_data(raw_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -241,7 +296,7 @@ def _normalize_news_data(raw_data: Dict[str, Any]) -> List[Dict[str, Any]]:
 
 # --- Data Fetching Functions ---
 
-def get_historical_data(ticker: str, period: str = "3mo") -> pd.DataFrame:
+def get_historical_data(ticker: str, period: str = "3mo", use_cache: bool = True) -> pd.DataFrame:
     """
     Fetch historical OHLCV data using yfinance with a session that impersonates a browser
     to avoid rate limiting.
@@ -249,6 +304,7 @@ def get_historical_data(ticker: str, period: str = "3mo") -> pd.DataFrame:
     Args:
         ticker: Stock symbol (e.g., "AAPL", "MSFT")
         period: Time period string ("1mo", "3mo", "6mo", "1y", "2y")
+        use_cache: Whether to reuse a cached frame for the same ticker and date range
         
     Returns:
         pandas DataFrame with DatetimeIndex and columns for OHLCV data.
@@ -260,6 +316,13 @@ def get_historical_data(ticker: str, period: str = "3mo") -> pd.DataFrame:
     ticker = ticker.upper().strip()
     months = _parse_period_to_months(period)
     start_date, end_date = _default_date_range(months)
+
+    cache_key = _cache_key(f"historical:{ticker}:{start_date}:{end_date}") if use_cache else None
+    if cache_key:
+        cached_df = load_object_from_cache(cache_key, HISTORICAL_CACHE_TTL)
+        if cached_df is not None:
+            logger.debug(f"Cache hit for historical data: {ticker}")
+            return cached_df
     
     logger.info(f"Fetching historical data for {ticker} from {start_date} to {end_date} using yfinance.")
     
@@ -278,6 +341,8 @@ def get_historical_data(ticker: str, period: str = "3mo") -> pd.DataFrame:
             return pd.DataFrame()
             
         logger.info(f"Successfully retrieved {len(df)} data points for {ticker}")
+        if cache_key:
+            save_object_to_cache(cache_key, df)
         return df
 
     except Exception as e:
@@ -299,7 +364,7 @@ def get_company_data(ticker: str, use_cache: bool = True) -> Dict[str, Any]:
     url = f"https://api.nasdaq.com/api/quote/{ticker}/summary?assetclass=stocks"
     headers = {"accept": "application/json", **DEFAULT_HEADERS}
     
-    raw_data = get_json(url, headers=headers, use_cache=use_cache)
+    raw_data = get_json(url, headers=headers, use_cache=use_cache, cache_ttl=COMPANY_CACHE_TTL)
     if not raw_data:
         logger.error(f"Failed to fetch company data for {ticker}")
         return {}
@@ -324,7 +389,7 @@ def get_news_data(ticker: str, limit: int = 10, offset: int = 0, use_cache: bool
     url = f"https://www.nasdaq.com/api/news/topic/articlebysymbol?q={ticker}|STOCKS&offset={offset}&limit={limit}&fallback=true"
     headers = {"accept": "application/json", **DEFAULT_HEADERS}
     
-    raw_data = get_json(url, headers=headers, use_cache=use_cache)
+    raw_data = get_json(url, headers=headers, use_cache=use_cache, cache_ttl=NEWS_CACHE_TTL)
     if not raw_data:
         logger.error(f"Failed to fetch news data for {ticker}")
         return []
@@ -337,22 +402,29 @@ def get_news_data(ticker: str, limit: int = 10, offset: int = 0, use_cache: bool
 def get_multiple_tickers_data(tickers: List[str], data_type: str = "company", **kwargs) -> Dict[str, Any]:
     """
     Fetch data for multiple tickers efficiently.
+
+    Tickers are fetched concurrently on a thread pool since each call is
+    dominated by network latency. A ticker whose fetch raises maps to None.
     """
-    results = {}
-    
-    for ticker in tickers:
+    fetchers = {
+        "company": get_company_data,
+        "historical": get_historical_data,
+        "news": get_news_data,
+    }
+    fetch = fetchers.get(data_type)
+    if fetch is None:
+        logger.error(f"Unknown data type: {data_type}")
+        return {}
+    if not tickers:
+        return {}
+
+    def _fetch_one(ticker: str) -> Any:
         try:
-            if data_type == "company":
-                results[ticker] = get_company_data(ticker, **kwargs)
-            elif data_type == "historical":
-                results[ticker] = get_historical_data(ticker, **kwargs)
-            elif data_type == "news":
-                results[ticker] = get_news_data(ticker, **kwargs)
-            else:
-                logger.error(f"Unknown data type: {data_type}")
-                
+            return fetch(ticker, **kwargs)
         except Exception as e:
             logger.error(f"Error fetching {data_type} data for {ticker}: {e}")
-            results[ticker] = None
-    
-    return results
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(16, len(tickers))) as executor:
+        # map() yields in submission order, keeping the caller's ticker order
+        return dict(zip(tickers, executor.map(_fetch_one, tickers)))
@@ -6,9 +6,10 @@ Standardizes everything so higher layers (researcher/trader) don't need to under
 
 Functions:
 - fundamentals_score(company_data: dict) -> float
+- fundamentals_score_batch(company_data_list: list[dict]) -> np.ndarray
 - technical_score(indicators: dict) -> float  
-- sentiment_score(news_data: list[dict]) -> float
-- news_score(news_data: list[dict]) -> float
+- sentiment_score(news_data: list[dict] | NewsBatch) -> float
+- news_score(news_data: list[dict] | NewsBatch) -> float
 
 Flow:
 Analysts fetch raw data → Raw data passed to scoring.py → 
@@ -17,7 +18,11 @@ Returns normalized float (0–100) → Research agents consume these scores.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+import re
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Iterable, Tuple, NamedTuple, Union
+import ahocorasick
+import numpy as np
 from .indicators import rsi, macd, sma, extract_closing_prices
 
 logger = logging.getLogger(__name__)
@@ -46,6 +51,116 @@ HIGH_IMPACT_NEGATIVE = [
 ]
 
 
+def _build_keyword_automaton(weighted_groups: Iterable[Tuple[List[str], int]]) -> ahocorasick.Automaton:
+    """
+    Build an Aho-Corasick automaton mapping each keyword to its combined weight.
+    
+    Keywords that appear in more than one group (e.g. "partnership", "recall")
+    carry the sum of their group weights, matching the per-list scans they replace.
+    
+    Args:
+        weighted_groups: Iterable of (keywords, weight) pairs
+        
+    Returns:
+        Automaton whose values are (keyword, weight) tuples
+    """
+    weights: Dict[str, int] = {}
+    for keywords, weight in weighted_groups:
+        for keyword in keywords:
+            weights[keyword] = weights.get(keyword, 0) + weight
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, weight in weights.items():
+        automaton.add_word(keyword, (keyword, weight))
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once at import so each article is scanned in a single pass
+SENTIMENT_AUTOMATON = _build_keyword_automaton([
+    (POSITIVE_KEYWORDS, 1),
+    (NEGATIVE_KEYWORDS, -1),
+])
+
+NEWS_AUTOMATON = _build_keyword_automaton([
+    (HIGH_IMPACT_POSITIVE, 10),
+    (HIGH_IMPACT_NEGATIVE, -12),  # Negative events weighted slightly more
+    (POSITIVE_KEYWORDS, 2),
+    (NEGATIVE_KEYWORDS, -2),
+])
+
+
+def _keyword_hits(automaton: ahocorasick.Automaton, text: str) -> Dict[str, int]:
+    """
+    Return the distinct keywords found in text with their weights.
+    
+    Each keyword counts once per text, however many times it occurs.
+    """
+    return dict(match for _, match in automaton.iter(text)) if text else {}
+
+
+@lru_cache(maxsize=8192)
+def _article_hits(text: str) -> Tuple[int, int, int]:
+    """
+    Scan an article's text once per process for both scorers.
+    
+    sentiment_score and news_score are usually run on the same articles,
+    often more than once per analysis, so results are cached by text.
+    
+    Returns:
+        (positive keyword count, negative keyword count, news impact weight)
+    """
+    positive = negative = 0
+    # A keyword listed as both positive and negative nets to zero and is
+    # ignored, so the two lists are expected not to overlap.
+    for weight in _keyword_hits(SENTIMENT_AUTOMATON, text).values():
+        if weight > 0:
+            positive += 1
+        elif weight < 0:
+            negative += 1
+    return positive, negative, sum(_keyword_hits(NEWS_AUTOMATON, text).values())
+
+
+class NewsBatch(NamedTuple):
+    """
+    Columnar news articles: parallel lists of titles and summaries.
+    
+    sentiment_score() and news_score() accept either a NewsBatch or the
+    list-of-dicts returned by nasdaq_api.get_news_data().
+    """
+    titles: List[str]
+    summaries: List[str]
+    
+    @classmethod
+    def from_dicts(cls, articles: List[Dict[str, Any]]) -> "NewsBatch":
+        """Build a batch from article dicts, skipping entries that are not dicts."""
+        articles = [article for article in articles if isinstance(article, dict)]
+        return cls([article.get("title") or "" for article in articles],
+                   [article.get("summary") or "" for article in articles])
+    
+    def texts(self) -> List[str]:
+        """Each article's title and summary joined and lowercased in one pass."""
+        return [f"{title or ''} {summary or ''}".lower()
+                for title, summary in zip(self.titles, self.summaries)]
+
+
+def _news_texts(news_data: Union[NewsBatch, List[Dict[str, Any]]]) -> Optional[List[str]]:
+    """Lowercased article texts for scoring, or None if news_data is invalid or empty."""
+    if isinstance(news_data, NewsBatch):
+        return news_data.texts()
+    if not news_data or not isinstance(news_data, list):
+        return None
+    return NewsBatch.from_dicts(news_data).texts()
+
+
+# Precompiled patterns for the numeric/market-cap parsers
+_NUMERIC_STRIP = re.compile(r"[$,%]")
+_MISSING_VALUES = frozenset({"n/a", "na", "--", "", "null"})
+_MCAP_STRIP = re.compile(r"[$,\s]")
+_MCAP_RE = re.compile(r"^([-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:E[-+]?\d+)?)([TBMK]?)$")
+_MCAP_SUFFIX = {"T": 1e12, "B": 1e9, "M": 1e6, "K": 1e3, "": 1.0}
+
+
 def _parse_numeric_value(value_str: str) -> float:
     """
     Parse numeric value from string, handling currency symbols and formatting.
@@ -58,13 +173,18 @@ def _parse_numeric_value(value_str: str) -> float:
     """
     if not value_str or not isinstance(value_str, str):
         return 0.0
-    
+    return _parse_numeric_str(value_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_numeric_str(value_str: str) -> float:
+    """Cached worker for _parse_numeric_value; values like "$150.25" repeat across calls."""
     try:
         # Remove common formatting characters
-        cleaned = value_str.replace("$", "").replace(",", "").replace("%", "").strip()
+        cleaned = _NUMERIC_STRIP.sub("", value_str).strip()
         
         # Handle special cases like "N/A", "--", etc.
-        if cleaned.lower() in ["n/a", "na", "--", "", "null"]:
+        if cleaned.lower() in _MISSING_VALUES:
             return 0.0
             
         return float(cleaned)
@@ -85,23 +205,37 @@ def _parse_market_cap(market_cap_str: str) -> float:
     """
     if not market_cap_str:
         return 0.0
-    
-    try:
-        cleaned = market_cap_str.replace("$", "").replace(",", "").strip().upper()
-        
-        if cleaned.endswith("T"):
-            return float(cleaned[:-1]) * 1e12
-        elif cleaned.endswith("B"):
-            return float(cleaned[:-1]) * 1e9
-        elif cleaned.endswith("M"):
-            return float(cleaned[:-1]) * 1e6
-        elif cleaned.endswith("K"):
-            return float(cleaned[:-1]) * 1e3
-        else:
-            return float(cleaned)
-    except (ValueError, TypeError):
+    if isinstance(market_cap_str, str):
+        # Normalize case/whitespace first so "$2.5t" and " $2.5T" share a cache entry
+        return _parse_market_cap_str(market_cap_str.strip().upper())
+    return _parse_market_cap_str.__wrapped__(market_cap_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_market_cap_str(market_cap_str: str) -> float:
+    """Cached worker for _parse_market_cap."""
+    match = _MCAP_RE.match(_MCAP_STRIP.sub("", market_cap_str.upper()))
+    if not match:
         logger.warning(f"Failed to parse market cap: {market_cap_str}")
         return 0.0
+    return float(match.group(1)) * _MCAP_SUFFIX[match.group(2)]
+
+
+FUNDAMENTAL_FIELDS = ("market_cap", "pe_ratio", "dividend_yield", "volume",
+                      "avg_volume", "price", "high_52week", "low_52week")
+
+# Below this many populated fields the fundamentals score is left neutral
+MIN_FUNDAMENTAL_FIELDS = 3
+
+
+def _is_thin_company_data(company_data: Dict[str, Any]) -> bool:
+    """True if too few fundamentals fields are populated to be worth scoring."""
+    return sum(1 for key in FUNDAMENTAL_FIELDS if company_data.get(key)) < MIN_FUNDAMENTAL_FIELDS
+
+
+def _parse_fields(company_data: Dict[str, Any], keys: Tuple[str, ...]) -> Tuple[float, ...]:
+    """Parse several numeric fields of company_data in one call (missing -> 0.0)."""
+    return tuple(_parse_numeric_value(company_data.get(key, "")) for key in keys)
 
 
 def fundamentals_score(company_data: Dict[str, Any]) -> float:
@@ -118,6 +252,10 @@ def fundamentals_score(company_data: Dict[str, Any]) -> float:
         logger.warning("Invalid or empty company data provided")
         return 50.0  # Neutral score for missing data
     
+    if _is_thin_company_data(company_data):
+        logger.debug(f"Too few fundamentals for {company_data.get('symbol', 'unknown')}, using neutral score")
+        return 50.0
+    
     score = 0.0
     
     try:
@@ -159,8 +297,7 @@ def fundamentals_score(company_data: Dict[str, Any]) -> float:
                 score += 3  # Low yield
         
         # Volume/Liquidity scoring (0-15 points)
-        volume = _parse_numeric_value(company_data.get("volume", ""))
-        avg_volume = _parse_numeric_value(company_data.get("avg_volume", ""))
+        volume, avg_volume = _parse_fields(company_data, ("volume", "avg_volume"))
         if volume > 0 and avg_volume > 0:
             volume_ratio = volume / avg_volume
             # Higher than average volume is generally positive
@@ -174,11 +311,11 @@ def fundamentals_score(company_data: Dict[str, Any]) -> float:
                 score += 5  # Low volume
         
         # 52-week position scoring (0-25 points)
-        current_price = _parse_numeric_value(company_data.get("price", ""))
-        high_52week = _parse_numeric_value(company_data.get("high_52week", ""))
-        low_52week = _parse_numeric_value(company_data.get("low_52week", ""))
+        current_price, high_52week, low_52week = _parse_fields(
+            company_data, ("price", "high_52week", "low_52week"))
         
-        if current_price > 0 and high_52week > 0 and low_52week > 0 and high_52week > low_52week:
+        # One guard covers missing fields and a degenerate (high <= low) range
+        if min(current_price, low_52week) > 0 and high_52week > low_52week:
             # Calculate position within 52-week range
             position = (current_price - low_52week) / (high_52week - low_52week)
             # Higher position in range is generally better
@@ -195,6 +332,85 @@ def fundamentals_score(company_data: Dict[str, Any]) -> float:
         return 50.0  # Return neutral score on error
 
 
+def fundamentals_score_batch(company_data_list: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Score many companies at once; same result as fundamentals_score() per row.
+    
+    Fields are parsed into columns and each tier is evaluated with numpy
+    column operations instead of re-entering the scalar scorer per ticker.
+    
+    Args:
+        company_data_list: List of normalized company data dicts
+        
+    Returns:
+        float64 array of fundamentals scores (0-100), one per input row
+    """
+    fields = FUNDAMENTAL_FIELDS
+    n = len(company_data_list)
+    columns = np.zeros((len(fields), n))
+    neutral = np.zeros(n, dtype=bool)
+    
+    for i, company_data in enumerate(company_data_list):
+        if not company_data or not isinstance(company_data, dict) or _is_thin_company_data(company_data):
+            neutral[i] = True
+            continue
+        try:
+            columns[0, i] = _parse_market_cap(company_data.get("market_cap", ""))
+            columns[1:, i] = _parse_fields(company_data, fields[1:])
+        except Exception as e:
+            logger.error(f"Error parsing fundamentals for row {i}: {e}")
+            neutral[i] = True
+    
+    market_cap, pe, dividend_yield, volume, avg_volume, price, high, low = columns
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Market Cap scoring (0-25 points)
+        score = np.select(
+            [market_cap >= 10e9, market_cap >= 2e9, market_cap > 0],
+            [25.0, 15 + (market_cap - 2e9) / (8e9) * 10, np.maximum(5, (market_cap / 2e9) * 15)],
+            default=0.0,
+        )
+        
+        # P/E Ratio scoring (0-20 points)
+        score += np.select(
+            [pe <= 0,
+             (15 <= pe) & (pe <= 25),
+             ((10 <= pe) & (pe < 15)) | ((25 < pe) & (pe <= 35)),
+             ((5 <= pe) & (pe < 10)) | ((35 < pe) & (pe <= 50)),
+             pe > 0],
+            [0.0, 20.0, 15.0, 10.0, 5.0],
+            default=0.0,
+        )
+        
+        # Dividend Yield scoring (0-15 points)
+        score += np.select(
+            [dividend_yield <= 0,
+             (2 <= dividend_yield) & (dividend_yield <= 6),
+             ((1 <= dividend_yield) & (dividend_yield < 2)) | ((6 < dividend_yield) & (dividend_yield <= 8)),
+             dividend_yield > 8,
+             dividend_yield > 0],
+            [0.0, 15.0, 10.0, 5.0, 3.0],
+            default=0.0,
+        )
+        
+        # Volume/Liquidity scoring (0-15 points)
+        has_volume = (volume > 0) & (avg_volume > 0)
+        volume_ratio = np.where(has_volume, volume / avg_volume, 0.0)
+        score += np.select(
+            [~has_volume, volume_ratio >= 1.5, volume_ratio >= 1.2, volume_ratio >= 0.8],
+            [0.0, 15.0, 12.0, 8.0],
+            default=5.0,
+        )
+        
+        # 52-week position scoring (0-25 points)
+        has_range = (price > 0) & (high > 0) & (low > 0) & (high > low)
+        score += np.where(has_range, (price - low) / (high - low) * 25, 0.0)
+    
+    score = np.clip(score, 0.0, 100.0)
+    score[neutral] = 50.0
+    return score
+
+
 def technical_score(indicators: Dict[str, Any]) -> float:
     """
     Convert technical indicators into a normalized 0-100 score.
@@ -273,45 +489,31 @@ def technical_score(indicators: Dict[str, Any]) -> float:
         return 50.0  # Return neutral score on error
 
 
-def sentiment_score(news_data: List[Dict[str, Any]]) -> float:
+def sentiment_score(news_data: Union[NewsBatch, List[Dict[str, Any]]]) -> float:
     """
     Analyze news sentiment and convert to normalized 0-100 score.
     
     Args:
-        news_data: List of news articles from nasdaq_api.get_news_data()
+        news_data: List of news articles from nasdaq_api.get_news_data(), or a NewsBatch
         
     Returns:
         Sentiment score (0-100)
     """
-    if not news_data or not isinstance(news_data, list):
+    texts = _news_texts(news_data)
+    if texts is None:
         logger.warning("Invalid or empty news data provided")
         return 50.0  # Neutral score for missing data
     
-    if len(news_data) == 0:
-        return 50.0
-    
     try:
         positive_count = 0
         negative_count = 0
         
-        for article in news_data:
-            if not isinstance(article, dict):
-                continue
-                
-            # Analyze title and summary
-            title = (article.get("title", "") or "").lower()
-            summary = (article.get("summary", "") or "").lower()
-            text = f"{title} {summary}"
-            
-            # Count positive keywords
-            for keyword in POSITIVE_KEYWORDS:
-                if keyword in text:
-                    positive_count += 1
-            
-            # Count negative keywords
-            for keyword in NEGATIVE_KEYWORDS:
-                if keyword in text:
-                    negative_count += 1
+        # Analyze title and summary of each article
+        for text in texts:
+            # Count positive and negative keywords
+            positive_hits, negative_hits, _ = _article_hits(text)
+            positive_count += positive_hits
+            negative_count += negative_hits
         
         total_sentiment = positive_count + negative_count
         
@@ -330,54 +532,28 @@ def sentiment_score(news_data: List[Dict[str, Any]]) -> float:
         return 50.0
 
 
-def news_score(news_data: List[Dict[str, Any]]) -> float:
+def news_score(news_data: Union[NewsBatch, List[Dict[str, Any]]]) -> float:
     """
     Analyze news impact and convert to normalized 0-100 score.
     Focuses on high-impact events that could significantly affect stock price.
     
     Args:
-        news_data: List of news articles from nasdaq_api.get_news_data()
+        news_data: List of news articles from nasdaq_api.get_news_data(), or a NewsBatch
         
     Returns:
         News impact score (0-100)
     """
-    if not news_data or not isinstance(news_data, list):
+    texts = _news_texts(news_data)
+    if texts is None:
         logger.warning("Invalid or empty news data provided")
         return 50.0  # Neutral score for missing data
     
-    if len(news_data) == 0:
-        return 50.0
-    
     try:
         score = 50.0  # Start with neutral base
         
-        for article in news_data:
-            if not isinstance(article, dict):
-                continue
-                
-            title = (article.get("title", "") or "").lower()
-            summary = (article.get("summary", "") or "").lower()
-            text = f"{title} {summary}"
-            
-            # Check for high-impact positive events
-            for event in HIGH_IMPACT_POSITIVE:
-                if event in text:
-                    score += 10  # Significant positive impact
-            
-            # Check for high-impact negative events
-            for event in HIGH_IMPACT_NEGATIVE:
-                if event in text:
-                    score -= 12  # Significant negative impact (slightly weighted more)
-            
-            # Check for general positive keywords (smaller impact)
-            for keyword in POSITIVE_KEYWORDS:
-                if keyword in text:
-                    score += 2
-            
-            # Check for general negative keywords (smaller impact)
-            for keyword in NEGATIVE_KEYWORDS:
-                if keyword in text:
-                    score -= 2
+        for text in texts:
+            # High-impact events and general keywords
+            score += _article_hits(text)[2]
         
         # Ensure score is within bounds
         final_score = max(0.0, min(100.0, score))
@@ -395,22 +571,26 @@ def technical_score_from_prices(closing_prices: List[float]) -> float:
     Calculate technical score directly from closing prices using indicators.
     
     Args:
-        closing_prices: List of closing prices
+        closing_prices: List (or 1-D array) of closing prices
         
     Returns:
         Technical score (0-100)
     """
-    if not closing_prices or len(closing_prices) < 50:
+    n_prices = len(closing_prices) if closing_prices is not None else 0
+    if n_prices < 50:
         logger.warning("Insufficient price data for technical analysis")
         return 50.0
     
     try:
+        # Convert once; every indicator below reads the same float64 array
+        prices = np.asarray(closing_prices, dtype=np.float64)
+        
         # Calculate indicators
-        rsi_value = rsi(closing_prices, 14)
-        macd_data = macd(closing_prices, 12, 26, 9)
-        sma_50_value = sma(closing_prices, 50)
-        sma_200_value = sma(closing_prices, 200) if len(closing_prices) >= 200 else None
-        current_price = closing_prices[-1] if closing_prices else None
+        rsi_value = rsi(prices, 14)
+        macd_data = macd(prices, 12, 26, 9)
+        sma_50_value = sma(prices, 50)
+        sma_200_value = sma(prices, 200) if n_prices >= 200 else None
+        current_price = float(prices[-1])
         
         # Create indicators dict
         indicators = {
@@ -428,11 +608,22 @@ def technical_score_from_prices(closing_prices: List[float]) -> float:
         return 50.0
 
 
+DEFAULT_COMPOSITE_WEIGHTS = {
+    "fundamentals": 0.4,
+    "technical": 0.3,
+    "sentiment": 0.15,
+    "news": 0.15
+}
+
+
 def composite_score(fundamentals: float, technical: float, sentiment: float, 
                    news: float, weights: Optional[Dict[str, float]] = None) -> float:
     """
     Calculate a weighted composite score from individual component scores.
     
+    Results are memoized on the scores and the weights' items, since the
+    same combination is typically recomputed across agents in one run.
+    
     Args:
         fundamentals: Fundamentals score (0-100)
         technical: Technical score (0-100)
@@ -443,18 +634,27 @@ def composite_score(fundamentals: float, technical: float, sentiment: float,
     Returns:
         Composite score (0-100)
     """
-    # Default weights
-    default_weights = {
-        "fundamentals": 0.4,
-        "technical": 0.3,
-        "sentiment": 0.15,
-        "news": 0.15
-    }
-    
     if weights is None:
-        weights = default_weights
+        weights = DEFAULT_COMPOSITE_WEIGHTS
+    
+    try:
+        weights_key = tuple(weights.items())
+        hash((fundamentals, technical, sentiment, news, weights_key))
+    except (AttributeError, TypeError):
+        # Unhashable input: compute without the cache (errors handled inside)
+        return _composite_score_cached.__wrapped__(fundamentals, technical, sentiment, news, weights)
+    return _composite_score_cached(fundamentals, technical, sentiment, news, weights_key)
+
+
+@lru_cache(maxsize=1024)
+def _composite_score_cached(fundamentals: float, technical: float, sentiment: float,
+                            news: float, weights: Any) -> float:
+    """Cached worker for composite_score; weights is a dict or a tuple of its items."""
+    default_weights = DEFAULT_COMPOSITE_WEIGHTS
     
     try:
+        weights = dict(weights)
+        
         # Normalize weights to sum to 1.0
         total_weight = sum(weights.values())
         if total_weight == 0:
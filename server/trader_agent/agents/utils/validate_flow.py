@@ -11,6 +11,7 @@ import sys
 import os
 import traceback
 from typing import Dict, Any, List
+import numpy as np
 import pandas as pd
 
 # Add current directory to path for imports
@@ -235,15 +236,13 @@ def test_integration():
         
         # Create realistic price data (100 days of upward trending prices)
         base_price = 100.0
-        price_data = []
-        for i in range(100):
-            # Add some randomness but maintain upward trend
-            daily_change = (i * 0.5) + ((-1) ** i) * 2  # Trending up with volatility
-            price_data.append(base_price + daily_change)
+        idx = np.arange(100)
+        # Trending up with volatility: +2 on even days, -2 on odd days
+        price_data = base_price + idx * 0.5 + np.where(idx & 1, -2.0, 2.0)
         
         # Step 1: Extract closing prices (simulated)
         closing_prices = price_data
-        assert len(closing_prices) >= 50
+        assert closing_prices.size >= 50
         
         # Step 2: Calculate technical indicators
         rsi_value = indicators.rsi(closing_prices, 14)